@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+
+# Shared ctypes bindings to libmwalib for the Python example scripts.
+
+# Adapted from:
+# http://jakegoulding.com/rust-ffi-omnibus/objects/
+
+# Additional documentation:
+# https://docs.python.org/3.8/library/ctypes.html#module-ctypes
+
+import sys
+import ctypes as ct
+import threading
+
+import numpy as np
+
+ERROR_MESSAGE_LEN = 1024
+DISPLAY_STRING_LEN = 1024 * 1024
+
+
+class CorrelatorContextS(ct.Structure):
+    pass
+
+
+class CorrelatorMetadataS(ct.Structure):
+    # Mirrors the repr(C) CorrelatorMetadata struct in src/ffi/mod.rs.
+    _fields_ = [
+        ("mwa_version", ct.c_int),
+        ("timesteps", ct.c_void_p),
+        ("num_timesteps", ct.c_size_t),
+        ("coarse_chans", ct.c_void_p),
+        ("num_coarse_chans", ct.c_size_t),
+        ("num_common_timesteps", ct.c_size_t),
+        ("common_timestep_indices", ct.POINTER(ct.c_size_t)),
+        ("num_common_coarse_chans", ct.c_size_t),
+        ("common_coarse_chan_indices", ct.POINTER(ct.c_size_t)),
+        ("common_start_unix_time_ms", ct.c_uint64),
+        ("common_end_unix_time_ms", ct.c_uint64),
+        ("common_start_gps_time_ms", ct.c_uint64),
+        ("common_end_gps_time_ms", ct.c_uint64),
+        ("common_duration_ms", ct.c_uint64),
+        ("common_bandwidth_hz", ct.c_uint32),
+        ("num_common_good_timesteps", ct.c_size_t),
+        ("common_good_timestep_indices", ct.POINTER(ct.c_size_t)),
+        ("num_common_good_coarse_chans", ct.c_size_t),
+        ("common_good_coarse_chan_indices", ct.POINTER(ct.c_size_t)),
+        ("common_good_start_unix_time_ms", ct.c_uint64),
+        ("common_good_end_unix_time_ms", ct.c_uint64),
+        ("common_good_start_gps_time_ms", ct.c_uint64),
+        ("common_good_end_gps_time_ms", ct.c_uint64),
+        ("common_good_duration_ms", ct.c_uint64),
+        ("common_good_bandwidth_hz", ct.c_uint32),
+        ("num_provided_timesteps", ct.c_size_t),
+        ("provided_timestep_indices", ct.POINTER(ct.c_size_t)),
+        ("num_provided_coarse_chans", ct.c_size_t),
+        ("provided_coarse_chan_indices", ct.POINTER(ct.c_size_t)),
+        ("num_timestep_coarse_chan_bytes", ct.c_size_t),
+        ("num_timestep_coarse_chan_floats", ct.c_size_t),
+        ("num_gpubox_files", ct.c_size_t),
+    ]
+
+
+prefix = {"win32": ""}.get(sys.platform, "lib")
+extension = {"darwin": ".dylib", "win32": ".dll"}.get(sys.platform, ".so")
+mwalib_filename = prefix + "mwalib" + extension
+mwalib = ct.cdll.LoadLibrary(mwalib_filename)
+
+mwalib.mwalib_correlator_context_new.argtypes = \
+    (ct.c_char_p,              # metafits
+     ct.POINTER(ct.c_char_p),  # gpuboxes
+     ct.c_size_t,              # gpubox count
+     ct.POINTER(ct.POINTER(CorrelatorContextS)), # Pointer to pointer to CorrelatorContext
+     ct.c_char_p,              # error message
+     ct.c_size_t)              # length of error message
+mwalib.mwalib_correlator_context_new.restype = ct.c_int32
+
+mwalib.mwalib_correlator_context_free.argtypes = (ct.POINTER(CorrelatorContextS), )
+
+mwalib.mwalib_correlator_context_display_string.argtypes = \
+    (ct.POINTER(CorrelatorContextS), # context
+     ct.c_char_p,               # out string
+     ct.c_size_t,               # length of out string
+     ct.c_char_p,               # error message
+     ct.c_size_t)               # length of error message
+mwalib.mwalib_correlator_context_display_string.restype = ct.c_int32
+
+mwalib.mwalib_correlator_context_read_by_baseline.argtypes = \
+    (ct.POINTER(CorrelatorContextS), # context
+     ct.c_size_t,                # input timestep_index
+     ct.c_size_t,                # input coarse_chan_index
+     ct.POINTER(ct.c_float),     # buffer_ptr
+     ct.c_size_t,                # buffer_len
+     ct.c_char_p,                # error message
+     ct.c_size_t)                # length of error message
+mwalib.mwalib_correlator_context_read_by_baseline.restype = ct.c_int32
+
+mwalib.mwalib_correlator_context_read_by_frequency.argtypes = \
+    (ct.POINTER(CorrelatorContextS), # context
+     ct.c_size_t,                # input timestep_index
+     ct.c_size_t,                # input coarse_chan_index
+     ct.POINTER(ct.c_float),     # buffer_ptr
+     ct.c_size_t,                # buffer_len
+     ct.c_char_p,               # error message
+     ct.c_size_t)               # length of error message
+mwalib.mwalib_correlator_context_read_by_frequency.restype = ct.c_int32
+
+mwalib.mwalib_correlator_metadata_get.argtypes = \
+    (ct.POINTER(CorrelatorContextS), # context
+     ct.POINTER(ct.POINTER(CorrelatorMetadataS)), # Pointer to pointer to CorrelatorMetadata
+     ct.c_char_p,               # error message
+     ct.c_size_t)               # length of error message
+mwalib.mwalib_correlator_metadata_get.restype = ct.c_int32
+
+mwalib.mwalib_correlator_metadata_free.argtypes = (ct.POINTER(CorrelatorMetadataS), )
+
+mwalib.mwalib_get_version_major.restype = ct.c_uint
+mwalib.mwalib_get_version_minor.restype = ct.c_uint
+mwalib.mwalib_get_version_patch.restype = ct.c_uint
+
+# Fetch the library version once at import; scripts (and any worker
+# processes re-importing this module) read the cached tuple instead of
+# making three FFI calls each time they want it.
+MWALIB_VERSION = (mwalib.mwalib_get_version_major(),
+                  mwalib.mwalib_get_version_minor(),
+                  mwalib.mwalib_get_version_patch())
+
+# Resolve the FFI entry points once; going through the CDLL attribute
+# on every call repeats a dict lookup in the hot loops.
+mwalib_correlator_context_new = mwalib.mwalib_correlator_context_new
+mwalib_correlator_context_free = mwalib.mwalib_correlator_context_free
+mwalib_correlator_context_display_string = \
+    mwalib.mwalib_correlator_context_display_string
+mwalib_correlator_context_read_by_baseline = \
+    mwalib.mwalib_correlator_context_read_by_baseline
+mwalib_correlator_context_read_by_frequency = \
+    mwalib.mwalib_correlator_context_read_by_frequency
+mwalib_correlator_metadata_get = mwalib.mwalib_correlator_metadata_get
+mwalib_correlator_metadata_free = mwalib.mwalib_correlator_metadata_free
+
+# One writable buffer for error messages raised outside the read path;
+# reads carry per-thread error buffers instead (see _read_state).
+error_message = ct.create_string_buffer(ERROR_MESSAGE_LEN)
+
+
+class CorrelatorContext:
+    def __init__(self, metafits, gpuboxes):
+        # Encode all inputs as UTF-8. The metafits bytes can be passed
+        # straight through - the c_char_p argtype converts it for us.
+        m = metafits.encode("utf-8")
+
+        # Populate a c_char_p array in place; assigning bytes to a slot
+        # avoids constructing an intermediate c_char_p object per file.
+        seq = ct.c_char_p * len(gpuboxes)
+        g = seq()
+        for i, gpubox in enumerate(gpuboxes):
+            g[i] = gpubox.encode("utf-8")
+
+        self.correlator_context = ct.POINTER(CorrelatorContextS)()
+
+        # Raise rather than print-and-continue: the metadata fetch below
+        # would otherwise run against a null context and bury the real
+        # cause under a null-pointer error.
+        if mwalib_correlator_context_new(m, g, len(gpuboxes), ct.byref(self.correlator_context), error_message, ERROR_MESSAGE_LEN) != 0:
+            raise Exception(
+                f"Error creating context: {ct.string_at(error_message).decode('utf-8')}")
+
+        # Pull the real dimensions from the correlator metadata rather
+        # than hard coding a single-channel legacy observation.
+        metadata_ptr = ct.POINTER(CorrelatorMetadataS)()
+        if mwalib_correlator_metadata_get(self.correlator_context, ct.byref(metadata_ptr),
+                                          error_message, ERROR_MESSAGE_LEN) != 0:
+            raise Exception(
+                f"Error getting correlator metadata: {ct.string_at(error_message).decode('utf-8')}")
+
+        metadata = metadata_ptr.contents
+        self.num_timesteps = metadata.num_timesteps
+        self.num_coarse_chans = metadata.num_coarse_chans
+        self.num_floats = metadata.num_timestep_coarse_chan_floats
+        # Indices we actually have data files for; iterating these skips
+        # missing timesteps/channels before any read is attempted.
+        self.provided_timestep_indices = \
+            metadata.provided_timestep_indices[:metadata.num_provided_timesteps]
+        self.provided_coarse_chan_indices = \
+            metadata.provided_coarse_chan_indices[:metadata.num_provided_coarse_chans]
+        mwalib_correlator_metadata_free(metadata_ptr)
+
+        # Per-thread read scratch (buffer, view, error buffer, index
+        # args). ctypes releases the GIL for the duration of the Rust
+        # call, so reads may run concurrently; each thread needs its own
+        # buffer to read into.
+        self._local = threading.local()
+
+    def _read_state(self):
+        """Lazily create the calling thread's reusable read scratch."""
+        try:
+            return self._local.state
+        except AttributeError:
+            buffer = (ct.c_float * self.num_floats)()
+            self._local.state = (buffer,
+                                 np.frombuffer(buffer, dtype=np.float32),
+                                 ct.create_string_buffer(ERROR_MESSAGE_LEN))
+            return self._local.state
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        mwalib_correlator_context_free(self.correlator_context)
+
+    def display(self):
+        # The display string comes back in a caller-allocated buffer and
+        # is printed once here, rather than Rust writing to stdout
+        # behind Python's back.
+        display_buffer = ct.create_string_buffer(DISPLAY_STRING_LEN)
+
+        if mwalib_correlator_context_display_string(self.correlator_context, display_buffer, DISPLAY_STRING_LEN,
+                                                    error_message, ERROR_MESSAGE_LEN) != 0:
+            print(
+                f"Error calling mwalib_correlator_context_display_string(): {ct.string_at(error_message).decode('utf-8')}")
+            exit(1)
+
+        print(ct.string_at(display_buffer).decode("utf-8"))
+
+    def read_by_baseline(self, timestep_index, coarse_chan_index):
+        # Plain Python ints are converted in C by the declared c_size_t
+        # argtypes; no per-call ctypes boxing needed on our side.
+        buffer, data, err = self._read_state()
+
+        if mwalib_correlator_context_read_by_baseline(self.correlator_context, timestep_index,
+                                                 coarse_chan_index,
+                                                 buffer, self.num_floats,
+                                                 err, ERROR_MESSAGE_LEN) != 0:
+            raise Exception(f"Error reading data: {ct.string_at(err).decode('utf-8')}")
+        else:
+            # Zero-copy float32 view over this thread's reused buffer.
+            return data
+
+    def read_by_frequency(self, timestep_index, coarse_chan_index):
+        # Plain Python ints are converted in C by the declared c_size_t
+        # argtypes; no per-call ctypes boxing needed on our side.
+        buffer, data, err = self._read_state()
+
+        if mwalib_correlator_context_read_by_frequency(self.correlator_context, timestep_index,
+                                                 coarse_chan_index,
+                                                 buffer, self.num_floats,
+                                                 err, ERROR_MESSAGE_LEN) != 0:
+            raise Exception(f"Error reading data: {ct.string_at(err).decode('utf-8')}")
+        else:
+            # Zero-copy float32 view over this thread's reused buffer.
+            return data
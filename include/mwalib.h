@@ -0,0 +1,1559 @@
+#pragma once
+
+#include <stdarg.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+/**
+ * The MWA's latitude on Earth in radians. This is -26d42m11.94986s.
+ */
+#define MWA_LATITUDE_RADIANS -0.4660608448386394
+
+/**
+ * The MWA's longitude on Earth in radians. This is 116d40m14.93485s.
+ */
+#define MWA_LONGITUDE_RADIANS 2.0362898668561042
+
+/**
+ * The MWA's altitude in metres.
+ */
+#define MWA_ALTITUDE_METRES 377.827
+
+/**
+ * the velocity factor of electic fields in RG-6 like coax cable
+ */
+#define MWA_COAX_V_FACTOR 1.204
+
+/**
+ * speed of light in m/s
+ */
+#define SPEED_OF_LIGHT_IN_VACUUM_M_PER_S 299792458.0
+
+/**
+ * mwalib FFI interface return codes
+ */
+#define MWALIB_SUCCESS 0
+
+#define MWALIB_FAILURE 1
+
+#define MWALIB_NO_DATA_FOR_TIMESTEP_COARSECHAN -1
+
+/**
+ * Enum for all of the known variants of file format based on Correlator version
+ *
+ */
+typedef enum MWAVersion {
+  /**
+   * MWA correlator (v1.0), having data files without any batch numbers.
+   */
+  CorrOldLegacy = 1,
+  /**
+   * MWA correlator (v1.0), having data files with "gpubox" and batch numbers in their names.
+   */
+  CorrLegacy = 2,
+  /**
+   * MWAX correlator (v2.0)
+   */
+  CorrMWAXv2 = 3,
+  /**
+   * Legacy VCS Recombined
+   */
+  VCSLegacyRecombined = 4,
+  /**
+   * MWAX VCS
+   */
+  VCSMWAXv2 = 5,
+} MWAVersion;
+
+typedef enum MWAMode {
+  No_Capture = 0,
+  Burst_Vsib = 1,
+  Sw_Cor_Vsib = 2,
+  Hw_Cor_Pkts = 3,
+  Rts_32t = 4,
+  Hw_Lfiles = 5,
+  Hw_Lfiles_Nomentok = 6,
+  Sw_Cor_Vsib_Nomentok = 7,
+  Burst_Vsib_Synced = 8,
+  Burst_Vsib_Raw = 9,
+  Lfiles_Client = 16,
+  No_Capture_Burst = 17,
+  Enter_Burst = 18,
+  Enter_Channel = 19,
+  Voltage_Raw = 20,
+  Corr_Mode_Change = 21,
+  Voltage_Start = 22,
+  Voltage_Stop = 23,
+  Voltage_Buffer = 24,
+  Mwax_Correlator = 30,
+  Mwax_Vcs = 31,
+} MWAMode;
+
+typedef enum GeometricDelaysApplied {
+  No = 0,
+  Zenith = 1,
+  TilePointing = 2,
+  AzElTracking = 3,
+} GeometricDelaysApplied;
+
+/**
+ * Visibility polarisation.
+ */
+typedef enum VisPol {
+  XX = 1,
+  XY = 2,
+  YX = 3,
+  YY = 4,
+} VisPol;
+
+/**
+ *
+ * `mwalib` correlator observation context. This represents the basic metadata for a correlator observation.
+ *
+ */
+typedef struct CorrelatorContext CorrelatorContext;
+
+/**
+ * `mwalib` metafits context. This represents the basic metadata for the observation.
+ *
+ */
+typedef struct MetafitsContext MetafitsContext;
+
+/**
+ *
+ * `mwalib` voltage captue system (VCS) observation context. This represents the basic metadata for a voltage capture observation.
+ *
+ */
+typedef struct VoltageContext VoltageContext;
+
+/**
+ * Representation in C of an `Antenna` struct
+ */
+typedef struct Antenna {
+  /**
+   * This is the antenna number.
+   * Nominally this is the field we sort by to get the desired output order of antenna.
+   * X and Y have the same antenna number. This is the sorted ordinal order of the antenna.None
+   * e.g. 0...N-1
+   */
+  uint32_t ant;
+  /**
+   * Numeric part of tile_name for the antenna. Each pol has the same value
+   * e.g. tile_name "tile011" hsa tile_id of 11
+   */
+  uint32_t tile_id;
+  /**
+   * Human readable name of the antenna
+   * X and Y have the same name
+   */
+  char *tile_name;
+  /**
+   * Index within the array of rfinput structs of the x pol
+   */
+  uintptr_t rfinput_x;
+  /**
+   * Index within the array of rfinput structs of the y pol
+   */
+  uintptr_t rfinput_y;
+  /**
+   *
+   * Note: the next 4 values are from the rfinput of which we have X and Y, however these values are the same for each pol so can be safely placed in the antenna struct
+   * for efficiency
+   *
+   * Electrical length in metres for this antenna and polarisation to the receiver
+   */
+  double electrical_length_m;
+  /**
+   * Antenna position North from the array centre (metres)
+   */
+  double north_m;
+  /**
+   * Antenna position East from the array centre (metres)
+   */
+  double east_m;
+  /**
+   * Antenna height from the array centre (metres)
+   */
+  double height_m;
+} Antenna;
+
+/**
+ * Representation in C of an `RFInput` struct
+ */
+typedef struct Rfinput {
+  /**
+   * This is the metafits order (0-n inputs)
+   */
+  uint32_t input;
+  /**
+   * This is the antenna number.
+   * Nominally this is the field we sort by to get the desired output order of antenna.
+   * X and Y have the same antenna number. This is the sorted ordinal order of the antenna.None
+   * e.g. 0...N-1
+   */
+  uint32_t ant;
+  /**
+   * Numeric part of tile_name for the antenna. Each pol has the same value
+   * e.g. tile_name "tile011" hsa tile_id of 11
+   */
+  uint32_t tile_id;
+  /**
+   * Human readable name of the antenna
+   * X and Y have the same name
+   */
+  char *tile_name;
+  /**
+   * Polarisation - X or Y
+   */
+  char *pol;
+  /**
+   * Electrical length in metres for this antenna and polarisation to the receiver
+   */
+  double electrical_length_m;
+  /**
+   * Antenna position North from the array centre (metres)
+   */
+  double north_m;
+  /**
+   * Antenna position East from the array centre (metres)
+   */
+  double east_m;
+  /**
+   * Antenna height from the array centre (metres)
+   */
+  double height_m;
+  /**
+   * AKA PFB to correlator input order (only relevant for pre V2 correlator)
+   */
+  uint32_t vcs_order;
+  /**
+   * Subfile order is the order in which this rf_input is desired in our final output of data
+   */
+  uint32_t subfile_order;
+  /**
+   * Is this rf_input flagged out (due to tile error, etc from metafits)
+   */
+  bool flagged;
+  /**
+   * Receiver number
+   */
+  uint32_t rec_number;
+  /**
+   * Receiver slot number
+   */
+  uint32_t rec_slot_number;
+} Rfinput;
+
+/**
+ *
+ * C Representation of a `Baseline` struct
+ *
+ */
+typedef struct Baseline {
+  /**
+   * Index in the `MetafitsContext` antenna array for antenna1 for this baseline
+   */
+  uintptr_t ant1_index;
+  /**
+   * Index in the `MetafitsContext` antenna array for antenna2 for this baseline
+   */
+  uintptr_t ant2_index;
+} Baseline;
+
+/**
+ * Representation in C of an `CoarseChannel` struct
+ */
+typedef struct CoarseChannel {
+  /**
+   * Correlator channel is 0 indexed (0..N-1)
+   */
+  uintptr_t corr_chan_number;
+  /**
+   * Receiver channel is 0-255 in the RRI recivers
+   */
+  uintptr_t rec_chan_number;
+  /**
+   * gpubox channel number
+   * Legacy e.g. obsid_datetime_gpuboxXX_00
+   * v2     e.g. obsid_datetime_gpuboxXXX_00
+   */
+  uintptr_t gpubox_number;
+  /**
+   * Width of a coarse channel in Hz
+   */
+  uint32_t chan_width_hz;
+  /**
+   * Starting frequency of coarse channel in Hz
+   */
+  uint32_t chan_start_hz;
+  /**
+   * Centre frequency of coarse channel in Hz
+   */
+  uint32_t chan_centre_hz;
+  /**
+   * Ending frequency of coarse channel in Hz
+   */
+  uint32_t chan_end_hz;
+} CoarseChannel;
+
+/**
+ *
+ * C Representation of a `TimeStep` struct
+ *
+ */
+typedef struct TimeStep {
+  /**
+   * UNIX time (in milliseconds to avoid floating point inaccuracy)
+   */
+  uint64_t unix_time_ms;
+  uint64_t gps_time_ms;
+} TimeStep;
+
+/**
+ *
+ * This a C struct to allow the caller to consume the metafits metadata
+ *
+ */
+typedef struct MetafitsMetadata {
+  /**
+   * Observation id
+   */
+  uint32_t obs_id;
+  /**
+   * ATTEN_DB  // global analogue attenuation, in dB
+   */
+  double global_analogue_attenuation_db;
+  /**
+   * RA tile pointing
+   */
+  double ra_tile_pointing_deg;
+  /**
+   * DEC tile pointing
+   */
+  double dec_tile_pointing_deg;
+  /**
+   * RA phase centre
+   */
+  double ra_phase_center_deg;
+  /**
+   * DEC phase centre
+   */
+  double dec_phase_center_deg;
+  /**
+   * AZIMUTH
+   */
+  double az_deg;
+  /**
+   * ALTITUDE
+   */
+  double alt_deg;
+  /**
+   * Zenith angle of the pointing centre in degrees
+   */
+  double za_deg;
+  /**
+   * AZIMUTH of the pointing centre in radians
+   */
+  double az_rad;
+  /**
+   * ALTITUDE (a.k.a. elevation) of the pointing centre in radians
+   */
+  double alt_rad;
+  /**
+   * Zenith angle of the pointing centre in radians
+   */
+  double za_rad;
+  /**
+   * Altitude of Sun
+   */
+  double sun_alt_deg;
+  /**
+   * Distance from pointing center to Sun
+   */
+  double sun_distance_deg;
+  /**
+   * Distance from pointing center to the Moon
+   */
+  double moon_distance_deg;
+  /**
+   * Distance from pointing center to Jupiter
+   */
+  double jupiter_distance_deg;
+  /**
+   * Local Sidereal Time
+   */
+  double lst_deg;
+  /**
+   * Local Sidereal Time in radians
+   */
+  double lst_rad;
+  /**
+   * Hour Angle of pointing center (as a string)
+   */
+  char *hour_angle_string;
+  /**
+   * GRIDNAME
+   */
+  char *grid_name;
+  /**
+   * GRIDNUM
+   */
+  int32_t grid_number;
+  /**
+   * CREATOR
+   */
+  char *creator;
+  /**
+   * PROJECT
+   */
+  char *project_id;
+  /**
+   * Observation name
+   */
+  char *obs_name;
+  /**
+   * MWA observation mode
+   */
+  enum MWAMode mode;
+  /**
+   * Which Geometric delays have been applied to the data
+   */
+  enum GeometricDelaysApplied geometric_delays_applied;
+  /**
+   * Have cable delays been applied to the data?    
+   */
+  bool cable_delays_applied;
+  /**
+   * Have calibration delays and gains been applied to the data?
+   */
+  bool calibration_delays_and_gains_applied;
+  /**
+   * Correlator fine_chan_resolution
+   */
+  uint32_t corr_fine_chan_width_hz;
+  /**
+   * Correlator mode dump time
+   */
+  uint64_t corr_int_time_ms;
+  /**
+   * Number of fine channels in each coarse channel for a correlator observation
+   */
+  uintptr_t num_corr_fine_chans_per_coarse;
+  /**
+   * RECVRS    Array of receiver numbers (this tells us how many receivers too)
+   */
+  uintptr_t *receivers;
+  /**
+   * DELAYS    Array of delays
+   */
+  uint32_t *delays;
+  /**
+   * Scheduled start (gps time) of observation
+   */
+  int64_t sched_start_utc;
+  /**
+   * Scheduled end (gps time) of observation
+   */
+  int64_t sched_end_utc;
+  /**
+   * Scheduled start (MJD) of observation
+   */
+  double sched_start_mjd;
+  /**
+   * Scheduled end (MJD) of observation
+   */
+  double sched_end_mjd;
+  /**
+   * Scheduled start (UNIX time) of observation
+   */
+  uint64_t sched_start_unix_time_ms;
+  /**
+   * Scheduled end (UNIX time) of observation
+   */
+  uint64_t sched_end_unix_time_ms;
+  /**
+   * Scheduled start (GPS) of observation
+   */
+  uint64_t sched_start_gps_time_ms;
+  /**
+   * Scheduled end (GPS) of observation
+   */
+  uint64_t sched_end_gps_time_ms;
+  /**
+   * Scheduled duration of observation
+   */
+  uint64_t sched_duration_ms;
+  /**
+   * Seconds of bad data after observation starts
+   */
+  uint64_t quack_time_duration_ms;
+  /**
+   * OBSID+QUACKTIM as Unix timestamp (first good timestep)
+   */
+  uint64_t good_time_unix_ms;
+  /**
+   * Good time expressed as GPS seconds
+   */
+  uint64_t good_time_gps_ms;
+  /**
+   * Total number of antennas (tiles) in the array
+   */
+  uintptr_t num_ants;
+  /**
+   * Array of antennas
+   */
+  struct Antenna *antennas;
+  /**
+   * The Metafits defines an rf chain for antennas(tiles) * pol(X,Y)
+   */
+  uintptr_t num_rf_inputs;
+  /**
+   * Array of rf inputs
+   */
+  struct Rfinput *rf_inputs;
+  /**
+   * Number of antenna pols. e.g. X and Y
+   */
+  uintptr_t num_ant_pols;
+  /**
+   * Number of baselines
+   */
+  uintptr_t num_baselines;
+  /**
+   * Baseline array
+   */
+  struct Baseline *baselines;
+  /**
+   * Number of visibility_pols
+   */
+  uintptr_t num_visibility_pols;
+  /**
+   * Number of coarse channels based on the metafits
+   */
+  uintptr_t num_metafits_coarse_chans;
+  /**
+   * metafits_coarse_chans array
+   */
+  struct CoarseChannel *metafits_coarse_chans;
+  /**
+   * Number of timesteps based on the metafits
+   */
+  uintptr_t num_metafits_timesteps;
+  /**
+   * metafits_timesteps array
+   */
+  struct TimeStep *metafits_timesteps;
+  /**
+   * Total bandwidth of observation assuming we have all coarse channels
+   */
+  uint32_t obs_bandwidth_hz;
+  /**
+   * Bandwidth of each coarse channel
+   */
+  uint32_t coarse_chan_width_hz;
+  /**
+   * Centre frequency of observation
+   */
+  uint32_t centre_freq_hz;
+  /**
+   * filename of metafits file used
+   */
+  char *metafits_filename;
+} MetafitsMetadata;
+
+/**
+ *
+ * C Representation of the `CorrelatorContext` metadata
+ *
+ */
+typedef struct CorrelatorMetadata {
+  /**
+   * Version of the correlator format
+   */
+  enum MWAVersion mwa_version;
+  /**
+   * This is an array of all known timesteps (union of metafits and provided timesteps from data files)
+   */
+  struct TimeStep *timesteps;
+  /**
+   * Count all known timesteps (union of metafits and provided timesteps from data files)
+   */
+  uintptr_t num_timesteps;
+  /**
+   * Vector of coarse channels which is the effectively the same as the metafits provided coarse channels
+   */
+  struct CoarseChannel *coarse_chans;
+  /**
+   * Count of coarse channels (same as metafits coarse channel count)
+   */
+  uintptr_t num_coarse_chans;
+  /**
+   * Count of common timesteps
+   */
+  uintptr_t num_common_timesteps;
+  /**
+   * Vector of (in)common timestep indices
+   */
+  uintptr_t *common_timestep_indices;
+  /**
+   * Count of common coarse channels
+   */
+  uintptr_t num_common_coarse_chans;
+  /**
+   * Indices of common coarse channels
+   */
+  uintptr_t *common_coarse_chan_indices;
+  /**
+   * The proper start of the observation (the time that is common to all
+   * provided gpubox files).
+   */
+  uint64_t common_start_unix_time_ms;
+  /**
+   * `end_time_ms` will is the actual end time of the observation
+   * i.e. start time of last common timestep plus integration time.
+   */
+  uint64_t common_end_unix_time_ms;
+  /**
+   * `start_unix_time_ms` but in GPS milliseconds
+   */
+  uint64_t common_start_gps_time_ms;
+  /**
+   * `end_unix_time_ms` but in GPS milliseconds
+   */
+  uint64_t common_end_gps_time_ms;
+  /**
+   * Total duration of observation (based on gpubox files)
+   */
+  uint64_t common_duration_ms;
+  /**
+   * Total bandwidth of the common coarse channels which have been provided (which may be less than or equal to the bandwith in the MetafitsContext)
+   */
+  uint32_t common_bandwidth_hz;
+  /**
+   * Number of common timesteps only including timesteps after the quack time
+   */
+  uintptr_t num_common_good_timesteps;
+  /**
+   * Vector of (in)common timestep indices only including timesteps after the quack time
+   */
+  uintptr_t *common_good_timestep_indices;
+  /**
+   * Number of common coarse channels only including timesteps after the quack time
+   */
+  uintptr_t num_common_good_coarse_chans;
+  /**
+   * Vector of (in)common timestep indices only including timesteps after the quack time
+   */
+  uintptr_t *common_good_coarse_chan_indices;
+  /**
+   * The start of the observation (the time that is common to all
+   * provided gpubox files) only including timesteps after the quack time
+   */
+  uint64_t common_good_start_unix_time_ms;
+  /**
+   * `end_unix_time_ms` is the common end time of the observation only including timesteps after the quack time
+   * i.e. start time of last common timestep plus integration time.
+   */
+  uint64_t common_good_end_unix_time_ms;
+  /**
+   * `common_good_start_unix_time_ms` but in GPS milliseconds
+   */
+  uint64_t common_good_start_gps_time_ms;
+  /**
+   * `common_good_end_unix_time_ms` but in GPS milliseconds
+   */
+  uint64_t common_good_end_gps_time_ms;
+  /**
+   * Total duration of common_good timesteps
+   */
+  uint64_t common_good_duration_ms;
+  /**
+   * Total bandwidth of the common coarse channels only including timesteps after the quack time
+   */
+  uint32_t common_good_bandwidth_hz;
+  /**
+   * Number of provided timestep indices we have at least *some* data for
+   */
+  uintptr_t num_provided_timesteps;
+  /**
+   * The indices of any timesteps which we have *some* data for
+   */
+  uintptr_t *provided_timestep_indices;
+  /**
+   * Number of provided coarse channel indices we have at least *some* data for
+   */
+  uintptr_t num_provided_coarse_chans;
+  /**
+   * The indices of any coarse channels which we have *some* data for
+   */
+  uintptr_t *provided_coarse_chan_indices;
+  /**
+   * The number of bytes taken up by a scan/timestep in each gpubox file.
+   */
+  uintptr_t num_timestep_coarse_chan_bytes;
+  /**
+   * The number of floats in each gpubox HDU.
+   */
+  uintptr_t num_timestep_coarse_chan_floats;
+  /**
+   * This is the number of gpubox files *per batch*.
+   */
+  uintptr_t num_gpubox_files;
+} CorrelatorMetadata;
+
+/**
+ *
+ * C Representation of the `VoltageContext` metadata
+ *
+ */
+typedef struct VoltageMetadata {
+  /**
+   * Version of the correlator format
+   */
+  enum MWAVersion mwa_version;
+  /**
+   * This is an array of all known timesteps (union of metafits and provided timesteps from data files)
+   */
+  struct TimeStep *timesteps;
+  /**
+   * Number of timesteps in the observation
+   */
+  uintptr_t num_timesteps;
+  /**
+   * The number of millseconds interval between timestep indices
+   */
+  uint64_t timestep_duration_ms;
+  /**
+   * Vector of coarse channels which is the effectively the same as the metafits provided coarse channels
+   */
+  struct CoarseChannel *coarse_chans;
+  /**
+   * Number of coarse channels after we've validated the input voltage files
+   */
+  uintptr_t num_coarse_chans;
+  /**
+   * Number of common timesteps
+   */
+  uintptr_t num_common_timesteps;
+  /**
+   * Vector of (in)common timestep indices
+   */
+  uintptr_t *common_timestep_indices;
+  /**
+   * Number of common coarse chans
+   */
+  uintptr_t num_common_coarse_chans;
+  /**
+   * Vector of (in)common coarse channel indices
+   */
+  uintptr_t *common_coarse_chan_indices;
+  /**
+   * The start of the observation (the time that is common to all
+   * provided data files).
+   */
+  uint64_t common_start_unix_time_ms;
+  /**
+   * `end_unix_time_ms` is the common end time of the observation
+   * i.e. start time of last common timestep plus integration time.
+   */
+  uint64_t common_end_unix_time_ms;
+  /**
+   * `start_unix_time_ms` but in GPS milliseconds
+   */
+  uint64_t common_start_gps_time_ms;
+  /**
+   * `end_unix_time_ms` but in GPS milliseconds
+   */
+  uint64_t common_end_gps_time_ms;
+  /**
+   * Total duration of common timesteps
+   */
+  uint64_t common_duration_ms;
+  /**
+   * Total bandwidth of the common coarse channels
+   */
+  uint32_t common_bandwidth_hz;
+  /**
+   * Number of common timesteps only including timesteps after the quack time
+   */
+  uintptr_t num_common_good_timesteps;
+  /**
+   * Vector of (in)common timestep indices only including timesteps after the quack time
+   */
+  uintptr_t *common_good_timestep_indices;
+  /**
+   * Number of common coarse channels only including timesteps after the quack time
+   */
+  uintptr_t num_common_good_coarse_chans;
+  /**
+   * Vector of (in)common coarse channel indices only including timesteps after the quack time
+   */
+  uintptr_t *common_good_coarse_chan_indices;
+  /**
+   * The start of the observation (the time that is common to all
+   * provided data files) only including timesteps after the quack time
+   */
+  uint64_t common_good_start_unix_time_ms;
+  /**
+   * `end_unix_time_ms` is the common end time of the observation only including timesteps after the quack time
+   * i.e. start time of last common timestep plus integration time.
+   */
+  uint64_t common_good_end_unix_time_ms;
+  /**
+   * `common_good_start_unix_time_ms` but in GPS milliseconds
+   */
+  uint64_t common_good_start_gps_time_ms;
+  /**
+   * `common_good_end_unix_time_ms` but in GPS milliseconds
+   */
+  uint64_t common_good_end_gps_time_ms;
+  /**
+   * Total duration of common_good timesteps
+   */
+  uint64_t common_good_duration_ms;
+  /**
+   * Total bandwidth of the common coarse channels only including timesteps after the quack time
+   */
+  uint32_t common_good_bandwidth_hz;
+  /**
+   * Number of provided timestep indices we have at least *some* data for
+   */
+  uintptr_t num_provided_timesteps;
+  /**
+   * The indices of any timesteps which we have *some* data for
+   */
+  uintptr_t *provided_timestep_indices;
+  /**
+   * Number of provided coarse channel indices we have at least *some* data for
+   */
+  uintptr_t num_provided_coarse_chans;
+  /**
+   * The indices of any coarse channels which we have *some* data for
+   */
+  uintptr_t *provided_coarse_chan_indices;
+  /**
+   * Bandwidth of each coarse channel
+   */
+  uint32_t coarse_chan_width_hz;
+  /**
+   * Volatge fine_chan_resolution (if applicable- MWA legacy is 10 kHz, MWAX is unchannelised i.e. the full coarse channel width)
+   */
+  uint32_t fine_chan_width_hz;
+  /**
+   * Number of fine channels in each coarse channel
+   */
+  uintptr_t num_fine_chans_per_coarse;
+  /**
+   * Number of bytes in each sample (a sample is a complex, thus includes r and i)
+   */
+  uint64_t sample_size_bytes;
+  /**
+   * Number of voltage blocks per timestep
+   */
+  uint64_t num_voltage_blocks_per_timestep;
+  /**
+   * Number of voltage blocks of samples in each second of data    
+   */
+  uint64_t num_voltage_blocks_per_second;
+  /**
+   * Number of samples in each voltage_blocks for each second of data per rf_input * fine_chans * real|imag
+   */
+  uint64_t num_samples_per_voltage_block;
+  /**
+   * The size of each voltage block    
+   */
+  uint64_t voltage_block_size_bytes;
+  /**
+   * Number of bytes used to store delays - for MWAX this is the same as a voltage block size, for legacy it is 0
+   */
+  uint64_t delay_block_size_bytes;
+  /**
+   * The amount of bytes to skip before getting into real data within the voltage files
+   */
+  uint64_t data_file_header_size_bytes;
+  /**
+   * Expected voltage file size
+   */
+  uint64_t expected_voltage_data_file_size_bytes;
+} VoltageMetadata;
+
+#ifdef __cplusplus
+extern "C" {
+#endif // __cplusplus
+
+/**
+ * Return the MAJOR version number of mwalib
+ *
+ * Uses the built crate in build.rs to generate at build time a built.rs module
+ *
+ * # Arguments
+ *
+ * * None
+ *
+ * # Returns
+ *
+ * * u16 representing the major version number of mwalib
+ *
+ */
+unsigned int mwalib_get_version_major(void);
+
+/**
+ * Return the MINOR version number of mwalib
+ *
+ * Uses the built crate in build.rs to generate at build time a built.rs module
+ *
+ * # Arguments
+ *
+ * * None
+ *
+ * # Returns
+ *
+ * * u16 representing the minor version number of mwalib
+ *
+ */
+unsigned int mwalib_get_version_minor(void);
+
+/**
+ * Return the PATCH version number of mwalib
+ *
+ * Uses the built crate in build.rs to generate at build time a built.rs module
+ *
+ * # Arguments
+ *
+ * * None
+ *
+ * # Returns
+ *
+ * * u16 representing the patch version number of mwalib
+ *
+ */
+unsigned int mwalib_get_version_patch(void);
+
+/**
+ * Free a rust-allocated CString.
+ *
+ * mwalib uses error strings to detail the caller with anything that went
+ * wrong. Non-rust languages cannot deallocate these strings; so, call this
+ * function with the pointer to do that.
+ *
+ * # Arguments
+ *
+ * * `rust_cstring` - pointer to a `char*` of a Rust string
+ *
+ *
+ * # Returns
+ *
+ * * MWALIB_SUCCESS on success, non-zero on failure
+ *
+ * # Safety
+ * * rust_cstring must not have already been freed and must point to a Rust string.
+ */
+int32_t mwalib_free_rust_cstring(char *rust_cstring);
+
+/**
+ * Create and return a pointer to an `MetafitsContext` struct given only a metafits file
+ *
+ * # Arguments
+ *
+ * * `metafits_filename` - pointer to char* buffer containing the full path and filename of a metafits file.
+ *
+ * * `mwa_version` - enum providing mwalib with the intended mwa version which the metafits should be interpreted.
+ *
+ * * `out_metafits_context_ptr` - A Rust-owned populated `MetafitsContext` pointer. Free with `mwalib_metafits_context_free'.
+ *
+ * * `error_message` - pointer to already allocated buffer for any error messages to be returned to the caller.
+ *
+ * * `error_message_length` - length of error_message char* buffer.
+ *
+ *
+ * # Returns
+ *
+ * * return MWALIB_SUCCESS on success, non-zero on failure
+ *
+ *
+ * # Safety
+ * * `error_message` *must* point to an already allocated `char*` buffer for any error messages.
+ * * Caller *must* call the `mwalib_metafits_context_free` function to release the rust memory.
+ */
+int32_t mwalib_metafits_context_new(const char *metafits_filename,
+                                    enum MWAVersion mwa_version,
+                                    struct MetafitsContext **out_metafits_context_ptr,
+                                    const char *error_message,
+                                    size_t error_message_length);
+
+/**
+ * Display an `MetafitsContext` struct.
+ *
+ *
+ * # Arguments
+ *
+ * * `metafits_context_ptr` - pointer to an already populated `MetafitsContext` object
+ *
+ * * `error_message` - pointer to already allocated buffer for any error messages to be returned to the caller.
+ *
+ * * `error_message_length` - length of error_message char* buffer.
+ *
+ *
+ * # Returns
+ *
+ * * MWALIB_SUCCESS on success, non-zero on failure
+ *
+ *
+ * # Safety
+ * * `error_message` *must* point to an already allocated char* buffer for any error messages.
+ * * `metafits_context_ptr` must contain an MetafitsContext object already populated via `mwalib_metafits_context_new`
+ */
+int32_t mwalib_metafits_context_display(const struct MetafitsContext *metafits_context_ptr,
+                                        const char *error_message,
+                                        size_t error_message_length);
+
+/**
+ * Free a previously-allocated `MetafitsContext` struct (and it's members).
+ *
+ * # Arguments
+ *
+ * * `metafits_context_ptr` - pointer to an already populated `MetafitsContext` object
+ *
+ *
+ * # Returns
+ *
+ * * MWALIB_SUCCESS on success, non-zero on failure
+ *
+ *
+ * # Safety
+ * * This must be called once caller is finished with the `MetafitsContext` object
+ * * `metafits_context_ptr` must point to a populated `MetafitsContext` object from the `mwalib_metafits_context_new` functions.
+ * * `metafits_context_ptr` must not have already been freed.
+ */
+int32_t mwalib_metafits_context_free(struct MetafitsContext *metafits_context_ptr);
+
+/**
+ * Create and return a pointer to an `CorrelatorContext` struct based on metafits and gpubox files
+ *
+ * # Arguments
+ *
+ * * `metafits_filename` - pointer to char* buffer containing the full path and filename of a metafits file.
+ *
+ * * `gpubox_filenames` - pointer to array of char* buffers containing the full path and filename of the gpubox FITS files.
+ *
+ * * `gpubox_count` - length of the gpubox char* array.
+ *
+ * * `out_correlator_context_ptr` - A Rust-owned populated `CorrelatorContext` pointer. Free with `mwalib_correlator_context_free`.
+ *
+ * * `error_message` - pointer to already allocated buffer for any error messages to be returned to the caller.
+ *
+ * * `error_message_length` - length of error_message char* buffer.
+ *
+ *
+ * # Returns
+ *
+ * * MWALIB_SUCCESS on success, non-zero on failure
+ *
+ *
+ * # Safety
+ * * `error_message` *must* point to an already allocated `char*` buffer for any error messages.
+ * * Caller *must* call function `mwalib_correlator_context_free` to release the rust memory.
+ */
+int32_t mwalib_correlator_context_new(const char *metafits_filename,
+                                      const char **gpubox_filenames,
+                                      size_t gpubox_count,
+                                      struct CorrelatorContext **out_correlator_context_ptr,
+                                      const char *error_message,
+                                      size_t error_message_length);
+
+/**
+ * Display an `CorrelatorContext` struct.
+ *
+ *
+ * # Arguments
+ *
+ * * `correlator_context_ptr` - pointer to an already populated `CorrelatorContext` object
+ *
+ * * `error_message` - pointer to already allocated buffer for any error messages to be returned to the caller.
+ *
+ * * `error_message_length` - length of error_message char* buffer.
+ *
+ *
+ * # Returns
+ *
+ * * MWALIB_SUCCESS on success, non-zero on failure
+ *
+ *
+ * # Safety
+ * * `error_message` *must* point to an already allocated char* buffer for any error messages.
+ * * `correlator_context_ptr` must contain an `CorrelatorContext` object already populated via `mwalib_correlator_context_new`
+ */
+int32_t mwalib_correlator_context_display(const struct CorrelatorContext *correlator_context_ptr,
+                                          const char *error_message,
+                                          size_t error_message_length);
+
+/**
+ * Write a formatted, human readable representation of the `CorrelatorContext` into
+ * a caller-allocated buffer.
+ *
+ * Unlike `mwalib_correlator_context_display`, nothing is written to stdout; the
+ * caller decides what to do with the string (e.g. print it once through its own
+ * I/O layer). The string is null terminated and truncated if the buffer is too
+ * small.
+ *
+ * # Arguments
+ *
+ * * `correlator_context_ptr` - pointer to an already populated `CorrelatorContext` object
+ *
+ * * `out_string` - pointer to already allocated buffer for the display string to be returned to the caller.
+ *
+ * * `out_string_length` - length of out_string char* buffer.
+ *
+ * * `error_message` - pointer to already allocated buffer for any error messages to be returned to the caller.
+ *
+ * * `error_message_length` - length of error_message char* buffer.
+ *
+ *
+ * # Returns
+ *
+ * * MWALIB_SUCCESS on success, non-zero on failure
+ *
+ *
+ * # Safety
+ * * `out_string` *must* point to an already allocated char* buffer.
+ * * `error_message` *must* point to an already allocated char* buffer for any error messages.
+ * * `correlator_context_ptr` must contain an `CorrelatorContext` object already populated via `mwalib_correlator_context_new`
+ */
+int32_t mwalib_correlator_context_display_string(const struct CorrelatorContext *correlator_context_ptr,
+                                                 char *out_string,
+                                                 size_t out_string_length,
+                                                 const char *error_message,
+                                                 size_t error_message_length);
+
+/**
+ * Read a single timestep / coarse channel of MWA data.
+ *
+ * This method takes as input a timestep_index and a coarse_chan_index to return one
+ * HDU of data in baseline,freq,pol,r,i format
+ *
+ * # Arguments
+ *
+ * * `correlator_context_ptr` - pointer to an already populated `CorrelatorContext` object.
+ *
+ * * `corr_timestep_index` - index within the CorrelatorContext timestep array for the desired timestep.
+ *
+ * * `corr_coarse_chan_index` - index within the CorrelatorContext coarse_chan array for the desired coarse channel.
+ *
+ * * `buffer_ptr` - pointer to caller-owned and allocated buffer to write data into.
+ *
+ * * `buffer_len` - length of `buffer_ptr`.
+ *
+ * * `error_message` - pointer to already allocated buffer for any error messages to be returned to the caller.
+ *
+ * * `error_message_length` - length of error_message char* buffer.
+ *
+ *
+ * # Returns
+ *
+ * * MWALIB_SUCCESS on success, MWALIB_NO_DATA_FOR_TIMESTEP_COARSE_CHAN if the combination of timestep and coarse channel has no associated data file (no data), any other non-zero code on failure
+ *
+ *
+ * # Safety
+ * * `error_message` *must* point to an already allocated char* buffer for any error messages.
+ * * `correlator_context_ptr` must point to a populated object from the `mwalib_correlator_context_new` function.
+ * * Caller *must* call `mwalib_correlator_context_free_read_buffer` function to release the rust memory.
+ */
+int32_t mwalib_correlator_context_read_by_baseline(struct CorrelatorContext *correlator_context_ptr,
+                                                   size_t corr_timestep_index,
+                                                   size_t corr_coarse_chan_index,
+                                                   float *buffer_ptr,
+                                                   size_t buffer_len,
+                                                   const char *error_message,
+                                                   size_t error_message_length);
+
+/**
+ * Read a single timestep / coarse channel of MWA data.
+ *
+ * This method takes as input a timestep_index and a coarse_chan_index to return one
+ * HDU of data in freq,baseline,pol,r,i format
+ *
+ * # Arguments
+ *
+ * * `correlator_context_ptr` - pointer to an already populated `CorrelatorContext` object.
+ *
+ * * `corr_timestep_index` - index within the CorrelatorContext timestep array for the desired timestep. This corresponds
+ *                      to TimeStep.get(context, N) where N is timestep_index.
+ *
+ * * `corr_coarse_chan_index` - index within the CorrelatorContext coarse_chan array for the desired coarse channel. This corresponds
+ *                            to CoarseChannel.get(context, N) where N is coarse_chan_index.
+ *
+ * * `buffer_ptr` - pointer to caller-owned and allocated buffer to write data into.
+ *
+ * * `buffer_len` - length of `buffer_ptr`.
+ *
+ * * `error_message` - pointer to already allocated buffer for any error messages to be returned to the caller.
+ *
+ * * `error_message_length` - length of error_message char* buffer.
+ *
+ *
+ * # Returns
+ *
+ * * MWALIB_SUCCESS on success, MWALIB_NO_DATA_FOR_TIMESTEP_COARSE_CHAN if the combination of timestep and coarse channel has no associated data file (no data), any other non-zero code on failure
+ *
+ *
+ * # Safety
+ * * `error_message` *must* point to an already allocated char* buffer for any error messages.
+ * * `correlator_context_ptr` must point to a populated object from the `mwalib_correlator_context_new` function.
+ * * Caller *must* call `mwalib_correlator_context_free_read_buffer` function to release the rust memory.
+ */
+int32_t mwalib_correlator_context_read_by_frequency(struct CorrelatorContext *correlator_context_ptr,
+                                                    size_t corr_timestep_index,
+                                                    size_t corr_coarse_chan_index,
+                                                    float *buffer_ptr,
+                                                    size_t buffer_len,
+                                                    const char *error_message,
+                                                    size_t error_message_length);
+
+/**
+ * Free a previously-allocated `CorrelatorContext` struct (and it's members).
+ *
+ * # Arguments
+ *
+ * * `correlator_context_ptr` - pointer to an already populated `CorrelatorContext` object
+ *
+ *
+ * # Returns
+ *
+ * * MWALIB_SUCCESS on success, non-zero on failure
+ *
+ *
+ * # Safety
+ * * This must be called once caller is finished with the `CorrelatorContext` object
+ * * `correlator_context_ptr` must point to a populated `CorrelatorContext` object from the `mwalib_correlator_context_new` function.
+ * * `correlator_context_ptr` must not have already been freed.
+ */
+int32_t mwalib_correlator_context_free(struct CorrelatorContext *correlator_context_ptr);
+
+/**
+ * Create and return a pointer to an `VoltageContext` struct based on metafits and voltage files
+ *
+ * # Arguments
+ *
+ * * `metafits_filename` - pointer to char* buffer containing the full path and filename of a metafits file.
+ *
+ * * `voltage_filenames` - pointer to array of char* buffers containing the full path and filename of the voltage files.
+ *
+ * * `voltage_file_count` - length of the voltage char* array.
+ *
+ * * `out_voltage_context_ptr` - A Rust-owned populated `VoltageContext` pointer. Free with `mwalib_voltage_context_free`.
+ *
+ * * `error_message` - pointer to already allocated buffer for any error messages to be returned to the caller.
+ *
+ * * `error_message_length` - length of error_message char* buffer.
+ *
+ *
+ * # Returns
+ *
+ * * MWALIB_SUCCESS on success, non-zero on failure
+ *
+ *
+ * # Safety
+ * * `error_message` *must* point to an already allocated `char*` buffer for any error messages.
+ * * Caller *must* call function `mwalib_voltage_context_free` to release the rust memory.
+ */
+int32_t mwalib_voltage_context_new(const char *metafits_filename,
+                                   const char **voltage_filenames,
+                                   size_t voltage_file_count,
+                                   struct VoltageContext **out_voltage_context_ptr,
+                                   const char *error_message,
+                                   size_t error_message_length);
+
+/**
+ * Display a `VoltageContext` struct.
+ *
+ *
+ * # Arguments
+ *
+ * * `voltage_context_ptr` - pointer to an already populated `VoltageContext` object
+ *
+ * * `error_message` - pointer to already allocated buffer for any error messages to be returned to the caller.
+ *
+ * * `error_message_length` - length of error_message char* buffer.
+ *
+ *
+ * # Returns
+ *
+ * * MWALIB_SUCCESS on success, non-zero on failure
+ *
+ *
+ * # Safety
+ * * `error_message` *must* point to an already allocated char* buffer for any error messages.
+ * * `voltage_context_ptr` must contain an `VoltageContext` object already populated via `mwalib_voltage_context_new`
+ */
+int32_t mwalib_voltage_context_display(const struct VoltageContext *voltage_context_ptr,
+                                       const char *error_message,
+                                       size_t error_message_length);
+
+/**
+ * Read a single timestep / coarse channel of MWA voltage data.
+ *
+ * This method takes as input a timestep_index and a coarse_chan_index to return one
+ * file-worth of voltage data.
+ *
+ * # Arguments
+ *
+ * * `voltage_context_ptr` - pointer to an already populated `VoltageContext` object.
+ *
+ * * `voltage_timestep_index` - index within the voltage timestep array for the desired timestep.
+ *
+ * * `voltage_coarse_chan_index` - index within the voltage coarse_chan array for the desired coarse channel.
+ *
+ * * `buffer_ptr` - pointer to caller-owned and allocated buffer of bytes to write data into. Buffer must be large enough
+ *                  for all of the data. Calculate the buffer size in bytes using:
+ *                  vcontext.voltage_block_size_bytes * vcontext.num_voltage_blocks_per_timestep
+ *
+ * * `buffer_len` - length of `buffer_ptr`.
+ *
+ * * `error_message` - pointer to already allocated buffer for any error messages to be returned to the caller.
+ *
+ * * `error_message_length` - length of error_message char* buffer.
+ *
+ *
+ * # Returns
+ *
+ * * MWALIB_SUCCESS on success, MWALIB_NO_DATA_FOR_TIMESTEP_COARSE_CHAN if the combination of timestep and coarse channel has no associated data file (no data), any other non-zero code on failure
+ *
+ *
+ * # Safety
+ * * `error_message` *must* point to an already allocated char* buffer for any error messages.
+ * * `voltage_context_ptr` must point to a populated object from the `mwalib_voltage_context_new` function.
+ * * Caller *must* call `mwalib_voltage_context_free_read_buffer` function to release the rust memory.
+ */
+int32_t mwalib_voltage_context_read_file(struct VoltageContext *voltage_context_ptr,
+                                         size_t voltage_timestep_index,
+                                         size_t voltage_coarse_chan_index,
+                                         unsigned char *buffer_ptr,
+                                         size_t buffer_len,
+                                         const char *error_message,
+                                         size_t error_message_length);
+
+/**
+ * Read a single second / coarse channel of MWA voltage data.
+ *
+ * This method takes as input a gps_time (in seconds) and a coarse_chan_index to return one
+ * second-worth of voltage data.
+ *
+ * # Arguments
+ *
+ * * `voltage_context_ptr` - pointer to an already populated `VoltageContext` object.
+ *
+ * * `gps_second_start` - GPS second which to start getting data at.
+ *
+ * * `gps_second_count` - How many GPS seconds of data to get (inclusive).
+ *
+ * * `voltage_coarse_chan_index` - index within the coarse_chan array for the desired coarse channel.
+ *
+ * * `buffer_ptr` - pointer to caller-owned and allocated buffer of bytes to write data into. Buffer must be large enough
+ *                  for all of the data. Calculate the buffer size in bytes using:
+ *                  (vcontext.voltage_block_size_bytes * vcontext.num_voltage_blocks_per_second) * gps_second_count
+ *
+ * * `buffer_len` - length of `buffer_ptr`.
+ *
+ * * `error_message` - pointer to already allocated buffer for any error messages to be returned to the caller.
+ *
+ * * `error_message_length` - length of error_message char* buffer.
+ *
+ *
+ * # Returns
+ *
+ * * MWALIB_SUCCESS on success, MWALIB_NO_DATA_FOR_TIMESTEP_COARSE_CHAN if the combination of timestep and coarse channel has no associated data file (no data), any other non-zero code on failure
+ *
+ *
+ * # Safety
+ * * `error_message` *must* point to an already allocated char* buffer for any error messages.
+ * * `voltage_context_ptr` must point to a populated object from the `mwalib_voltage_context_new` function.
+ * * Caller *must* call `mwalib_voltage_context_free_read_buffer` function to release the rust memory.
+ */
+int32_t mwalib_voltage_context_read_second(struct VoltageContext *voltage_context_ptr,
+                                           unsigned long gps_second_start,
+                                           size_t gps_second_count,
+                                           size_t voltage_coarse_chan_index,
+                                           unsigned char *buffer_ptr,
+                                           size_t buffer_len,
+                                           const char *error_message,
+                                           size_t error_message_length);
+
+/**
+ * Free a previously-allocated `VoltageContext` struct (and it's members).
+ *
+ * # Arguments
+ *
+ * * `voltage_context_ptr` - pointer to an already populated `VoltageContext` object
+ *
+ *
+ * # Returns
+ *
+ * * MWALIB_SUCCESS on success, non-zero on failure
+ *
+ *
+ * # Safety
+ * * This must be called once caller is finished with the `VoltageContext` object
+ * * `voltage_context_ptr` must point to a populated `VoltageContext` object from the `mwalib_voltage_context_new` function.
+ * * `voltage_context_ptr` must not have already been freed.
+ */
+int32_t mwalib_voltage_context_free(struct VoltageContext *voltage_context_ptr);
+
+/**
+ * This passed back a struct containing the `MetafitsContext` metadata, given a MetafitsContext, CorrelatorContext or VoltageContext
+ *
+ * # Arguments
+ *
+ * * `metafits_context_ptr` - pointer to an already populated `MetafitsContext` object. (Exclusive with correlator_context_ptr and voltage_context_ptr)
+ *
+ * * `correlator_context_ptr` - pointer to an already populated `CorrelatorContext` object. (Exclusive with metafits_context_ptr and voltage_context_ptr)
+ *
+ * * `voltage_context_ptr` - pointer to an already populated `VoltageContext` object. (Exclusive with metafits_context_ptr and correlator_context_ptr)
+ *
+ * * `out_metafits_metadata_ptr` - pointer to a Rust-owned `mwalibMetafitsMetadata` struct. Free with `mwalib_metafits_metadata_free`
+ *
+ * * `error_message` - pointer to already allocated buffer for any error messages to be returned to the caller.
+ *
+ * * `error_message_length` - length of error_message char* buffer.
+ *
+ *
+ * # Returns
+ *
+ * * MWALIB_SUCCESS on success, non-zero on failure
+ *
+ *
+ * # Safety
+ * * `error_message` *must* point to an already allocated char* buffer for any error messages.
+ * * `metafits_context_ptr` must point to a populated MetafitsContext object from the `mwalib_metafits_context_new` function OR
+ * * `correlator_context_ptr` must point to a populated CorrelatorContext object from the 'mwalib_correlator_context_new' function OR
+ * * `voltage_context_ptr` must point to a populated VoltageContext object from the `mwalib_voltage_context_new` function. (Set the unused contexts to NULL).
+ * * Caller must call `mwalib_metafits_metadata_free` once finished, to free the rust memory.
+ */
+int32_t mwalib_metafits_metadata_get(struct MetafitsContext *metafits_context_ptr,
+                                     struct CorrelatorContext *correlator_context_ptr,
+                                     struct VoltageContext *voltage_context_ptr,
+                                     struct MetafitsMetadata **out_metafits_metadata_ptr,
+                                     const char *error_message,
+                                     size_t error_message_length);
+
+/**
+ * Free a previously-allocated `mwalibMetafitsMetadata` struct.
+ *
+ * # Arguments
+ *
+ * * `metafits_metadata_ptr` - pointer to an already populated `mwalibMetafitsMetadata` object
+ *
+ *
+ * # Returns
+ *
+ * * MWALIB_SUCCESS on success, non-zero on failure
+ *
+ *
+ * # Safety
+ * * This must be called once caller is finished with the `mwalibMetafitsMetadata` object
+ * * `metafits_metadata_ptr` must point to a populated `mwalibMetafitsMetadata` object from the `mwalib_metafits_metadata_get` function.
+ * * `metafits_metadata_ptr` must not have already been freed.
+ */
+int32_t mwalib_metafits_metadata_free(struct MetafitsMetadata *metafits_metadata_ptr);
+
+/**
+ * This returns a struct containing the `CorrelatorContext` metadata
+ *
+ * # Arguments
+ *
+ * * `correlator_context_ptr` - pointer to an already populated `CorrelatorContext` object.
+ *
+ * * `out_correaltor_metadata_ptr` - A Rust-owned populated `CorrelatorMetadata` struct. Free with `mwalib_correlator_metadata_free`.
+ *
+ * * `error_message` - pointer to already allocated buffer for any error messages to be returned to the caller.
+ *
+ * * `error_message_length` - length of error_message char* buffer.
+ *
+ *
+ * # Returns
+ *
+ * * MWALIB_SUCCESS on success, non-zero on failure
+ *
+ *
+ * # Safety
+ * * `error_message` *must* point to an already allocated char* buffer for any error messages.
+ * * `correlator_context_ptr` must point to a populated `CorrelatorContext` object from the `mwalib_correlator_context_new` function.
+ * * Caller must call `mwalib_correlator_metadata_free` once finished, to free the rust memory.
+ */
+int32_t mwalib_correlator_metadata_get(struct CorrelatorContext *correlator_context_ptr,
+                                       struct CorrelatorMetadata **out_correlator_metadata_ptr,
+                                       const char *error_message,
+                                       size_t error_message_length);
+
+/**
+ * Free a previously-allocated `CorrelatorMetadata` struct.
+ *
+ * # Arguments
+ *
+ * * `correlator_metadata_ptr` - pointer to an already populated `CorrelatorMetadata` object
+ *
+ *
+ * # Returns
+ *
+ * * MWALIB_SUCCESS on success, non-zero on failure
+ *
+ *
+ * # Safety
+ * * This must be called once caller is finished with the `CorrelatorMetadata` object
+ * * `correlator_metadata_ptr` must point to a populated `CorrelatorMetadata` object from the `mwalib_correlator_metadata_get` function.
+ * * `correlator_metadata_ptr` must not have already been freed.
+ */
+int32_t mwalib_correlator_metadata_free(struct CorrelatorMetadata *correlator_metadata_ptr);
+
+/**
+ * This returns a struct containing the `VoltageContext` metadata
+ *
+ * # Arguments
+ *
+ * * `voltage_context_ptr` - pointer to an already populated `VoltageContext` object.
+ *
+ * * `out_voltage_metadata_ptr` - A Rust-owned populated `VoltageMetadata` struct. Free with `mwalib_voltage_metadata_free`.
+ *
+ * * `error_message` - pointer to already allocated buffer for any error messages to be returned to the caller.
+ *
+ * * `error_message_length` - length of error_message char* buffer.
+ *
+ *
+ * # Returns
+ *
+ * * MWALIB_SUCCESS on success, non-zero on failure
+ *
+ *
+ * # Safety
+ * * `error_message` *must* point to an already allocated char* buffer for any error messages.
+ * * `voltage_context_ptr` must point to a populated `VoltageContext` object from the `mwalib_voltage_context_new` function.
+ * * Caller must call `mwalib_voltage_metadata_free` once finished, to free the rust memory.
+ */
+int32_t mwalib_voltage_metadata_get(struct VoltageContext *voltage_context_ptr,
+                                    struct VoltageMetadata **out_voltage_metadata_ptr,
+                                    const char *error_message,
+                                    size_t error_message_length);
+
+/**
+ * Free a previously-allocated `VoltageMetadata` struct.
+ *
+ * # Arguments
+ *
+ * * `voltage_metadata_ptr` - pointer to an already populated `VoltageMetadata` object
+ *
+ *
+ * # Returns
+ *
+ * * MWALIB_SUCCESS on success, non-zero on failure
+ *
+ *
+ * # Safety
+ * * This must be called once caller is finished with the `VoltageMetadata` object
+ * * `voltage_metadata_ptr` must point to a populated `VoltageMetadata` object from the `mwalib_voltage_metadata_get` function.
+ * * `voltage_metadata_ptr` must not have already been freed.
+ */
+int32_t mwalib_voltage_metadata_free(struct VoltageMetadata *voltage_metadata_ptr);
+
+#ifdef __cplusplus
+}  // extern "C"
+#endif  // __cplusplus
@@ -55,7 +55,7 @@ fn set_error_message(in_message: &str, error_buffer_ptr: *mut u8, error_buffer_l
     }
     // Trim it to error_buffer_len - 1 (must include room for null terminator)
     let in_buffer_len = in_message.len();
-    let message = if in_buffer_len > error_buffer_len {
+    let message = if in_buffer_len >= error_buffer_len {
         &in_message[..error_buffer_len - 1]
     } else {
         in_message
@@ -64,8 +64,10 @@ fn set_error_message(in_message: &str, error_buffer_ptr: *mut u8, error_buffer_l
     // Convert to C string- panic if it can't.
     let error_message = CString::new(message).unwrap();
 
-    // Add null terminator
-    let error_message_bytes = error_message.as_bytes();
+    // Add null terminator. Callers may reuse the buffer across calls, so
+    // the terminator must be written too or a shorter message would come
+    // back with the tail of the previous one attached.
+    let error_message_bytes = error_message.as_bytes_with_nul();
 
     unsafe {
         // Reconstruct a string to write into
@@ -417,6 +419,73 @@ pub unsafe extern "C" fn mwalib_correlator_context_display(
     MWALIB_SUCCESS
 }
 
+/// Write a formatted, human readable representation of the `CorrelatorContext` into
+/// a caller-allocated buffer.
+///
+/// Unlike `mwalib_correlator_context_display`, nothing is written to stdout; the
+/// caller decides what to do with the string (e.g. print it once through its own
+/// I/O layer). The string is null terminated and truncated if the buffer is too
+/// small.
+///
+/// # Arguments
+///
+/// * `correlator_context_ptr` - pointer to an already populated `CorrelatorContext` object
+///
+/// * `out_string` - pointer to already allocated buffer for the display string to be returned to the caller.
+///
+/// * `out_string_length` - length of out_string char* buffer.
+///
+/// * `error_message` - pointer to already allocated buffer for any error messages to be returned to the caller.
+///
+/// * `error_message_length` - length of error_message char* buffer.
+///
+///
+/// # Returns
+///
+/// * MWALIB_SUCCESS on success, non-zero on failure
+///
+///
+/// # Safety
+/// * `out_string` *must* point to an already allocated char* buffer.
+/// * `error_message` *must* point to an already allocated char* buffer for any error messages.
+/// * `correlator_context_ptr` must contain an `CorrelatorContext` object already populated via `mwalib_correlator_context_new`
+#[no_mangle]
+pub unsafe extern "C" fn mwalib_correlator_context_display_string(
+    correlator_context_ptr: *const CorrelatorContext,
+    out_string: *mut c_char,
+    out_string_length: size_t,
+    error_message: *const c_char,
+    error_message_length: size_t,
+) -> i32 {
+    if correlator_context_ptr.is_null() {
+        set_error_message(
+            "mwalib_correlator_context_display_string() ERROR: null pointer for correlator_context_ptr passed in",
+            error_message as *mut u8,
+            error_message_length,
+        );
+        return MWALIB_FAILURE;
+    }
+    if out_string.is_null() {
+        set_error_message(
+            "mwalib_correlator_context_display_string() ERROR: null pointer for out_string passed in",
+            error_message as *mut u8,
+            error_message_length,
+        );
+        return MWALIB_FAILURE;
+    }
+
+    let context = &*correlator_context_ptr;
+
+    set_error_message(
+        &format!("{}", context),
+        out_string as *mut u8,
+        out_string_length,
+    );
+
+    // Return success
+    MWALIB_SUCCESS
+}
+
 /// Read a single timestep / coarse channel of MWA data.
 ///
 /// This method takes as input a timestep_index and a coarse_chan_index to return one
@@ -196,6 +196,20 @@ fn test_set_error_message() {
     assert_eq!(buffer, CString::new("hello world").unwrap());
 }
 
+#[test]
+fn test_set_error_message_reused_buffer() {
+    // A shorter message written after a longer one must not come back
+    // with the tail of the previous message still attached.
+    let buffer = CString::new(" ".repeat(64)).unwrap();
+    let buffer_ptr = buffer.as_ptr() as *mut u8;
+
+    set_error_message("a long error message", buffer_ptr, 64);
+    set_error_message("short", buffer_ptr, 64);
+
+    let read_back = unsafe { CStr::from_ptr(buffer_ptr as *const c_char) };
+    assert_eq!(read_back.to_str().unwrap(), "short");
+}
+
 #[test]
 fn test_set_error_message_null_ptr() {
     let buffer_ptr: *mut u8 = std::ptr::null_mut();
@@ -515,6 +529,83 @@ fn test_mwalib_correlator_context_display_null_ptr() {
     }
 }
 
+#[test]
+fn test_mwalib_correlator_context_display_string() {
+    let correlator_context_ptr: *mut CorrelatorContext = get_test_ffi_correlator_context();
+
+    let out_len: size_t = 1024 * 1024;
+    let out_string = CString::new(" ".repeat(out_len)).unwrap();
+    let out_string_ptr = out_string.as_ptr() as *mut c_char;
+
+    let error_len: size_t = 128;
+    let error_message = CString::new(" ".repeat(error_len)).unwrap();
+    let error_message_ptr = error_message.as_ptr() as *const c_char;
+
+    unsafe {
+        let retval = mwalib_correlator_context_display_string(
+            correlator_context_ptr,
+            out_string_ptr,
+            out_len,
+            error_message_ptr,
+            error_len,
+        );
+
+        assert_eq!(retval, 0);
+
+        // Check the context was written into the caller's buffer
+        let display = CStr::from_ptr(out_string_ptr).to_str().unwrap();
+        assert!(display.contains("CorrelatorContext"));
+    }
+}
+
+#[test]
+fn test_mwalib_correlator_context_display_string_null_ptr() {
+    let correlator_context_ptr: *mut CorrelatorContext = std::ptr::null_mut();
+
+    let out_len: size_t = 1024 * 1024;
+    let out_string = CString::new(" ".repeat(out_len)).unwrap();
+    let out_string_ptr = out_string.as_ptr() as *mut c_char;
+
+    let error_len: size_t = 128;
+    let error_message = CString::new(" ".repeat(error_len)).unwrap();
+    let error_message_ptr = error_message.as_ptr() as *const c_char;
+
+    unsafe {
+        let retval = mwalib_correlator_context_display_string(
+            correlator_context_ptr,
+            out_string_ptr,
+            out_len,
+            error_message_ptr,
+            error_len,
+        );
+
+        assert_ne!(retval, 0);
+    }
+}
+
+#[test]
+fn test_mwalib_correlator_context_display_string_null_out_string() {
+    let correlator_context_ptr: *mut CorrelatorContext = get_test_ffi_correlator_context();
+
+    let out_string_ptr: *mut c_char = std::ptr::null_mut();
+
+    let error_len: size_t = 128;
+    let error_message = CString::new(" ".repeat(error_len)).unwrap();
+    let error_message_ptr = error_message.as_ptr() as *const c_char;
+
+    unsafe {
+        let retval = mwalib_correlator_context_display_string(
+            correlator_context_ptr,
+            out_string_ptr,
+            0,
+            error_message_ptr,
+            error_len,
+        );
+
+        assert_ne!(retval, 0);
+    }
+}
+
 #[test]
 fn test_mwalib_correlator_context_legacy_read_by_baseline_valid() {
     let correlator_context_ptr: *mut CorrelatorContext = get_test_ffi_correlator_context();
@@ -48,23 +48,23 @@
 # * mwalib and pyuvdata differ from cotter: Cotter sets XY to 0+0j for all cases where ant1==ant2.
 #
 import argparse
-from pymwalib.correlator_context import CorrelatorContext
-from pyuvdata import UVData
-import casacore.tables
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 def get_baseline_from_antennas(antenna1, antenna2, num_antennas):
-    baseline_index = 0
-    for ant1 in range(0,num_antennas):
-        for ant2 in range(ant1, num_antennas):
-            if ant1 == antenna1 and ant2 == antenna2:
-                return baseline_index
+    # Closed-form index into the upper triangle (including self-pairs):
+    # rows 0..antenna1-1 contribute (num_antennas - row) baselines each.
+    if not 0 <= antenna1 <= antenna2 < num_antennas:
+        # Baseline was not found at all
+        return None
 
-            baseline_index += 1
+    return antenna1 * (2 * num_antennas - antenna1 + 1) // 2 + (antenna2 - antenna1)
 
-    # Baseline was not found at all
-    return None
+def dump_mwalib(ant1, ant2, timestep_index, coarse_chan_index, fine_chan_index, fine_chan_count, gpuboxfiles, metafits, out_filename):
+    # Imported here so each dump only pays for the packages it uses.
+    from pymwalib.correlator_context import CorrelatorContext
 
-def dump_mwalib(ant1, ant2, timestep_index, fine_chan_index, fine_chan_count, gpuboxfiles, metafits, out_filename):
     print("pymwalib:")
     print("======================================")
     with CorrelatorContext(metafits, gpuboxfiles) as cc:
@@ -94,21 +94,24 @@ def dump_mwalib(ant1, ant2, timestep_index, fine_chan_index, fine_chan_count, gp
                       f"YX: {data[data_fine_index + 4]:.2f} {data[data_fine_index + 5]:.2f},\t"
                       f"YY: {data[data_fine_index + 6]:.2f} {data[data_fine_index + 7]:.2f}")
         else:
-            with open(out_filename, "w") as out_file:
-                for baseline_index in range(0, int(128*129/2)):
-                    data_bl_index = baseline_index * (
-                        cc.metafits_context.num_corr_fine_chans_per_coarse * cc.num_visibility_pols * 2)
-
-                    for chan in range(fine_chan_index, fine_chan_index + fine_chan_count):
-                        data_fine_index = data_bl_index + (chan * cc.num_visibility_pols * 2)
-
-                        out_file.write(f"{data[data_fine_index]},{data[data_fine_index + 1]},"
-                                       f"{data[data_fine_index + 2]},{data[data_fine_index + 3]},"
-                                       f"{data[data_fine_index + 4]},{data[data_fine_index + 5]},"
-                                       f"{data[data_fine_index + 6]},{data[data_fine_index + 7]}\n")
+            # View the HDU as (baseline, fine channel, 8 floats), slice the
+            # requested channels and let numpy format the whole slab in one
+            # call instead of ~1M per-row f-strings and writes.
+            num_fine_chans = cc.metafits_context.num_corr_fine_chans_per_coarse
+            num_float_cols = cc.metafits_context.num_visibility_pols * 2
+            n_bls = int(128 * 129 / 2)
+
+            slab = np.asarray(data).reshape(n_bls, num_fine_chans, num_float_cols)
+            slab = slab[:, fine_chan_index:fine_chan_index + fine_chan_count, :]
+
+            np.savetxt(out_filename, slab.reshape(-1, num_float_cols),
+                       fmt="%g", delimiter=",")
             print(f"Wrote {out_filename}")
 
 def dump_pyuvdata(ant1, ant2, timestep_index, fine_chan_index, fine_chan_count, gpuboxfiles, metafits, out_filename):
+    # pyuvdata drags in the astropy import chain; only pay for it here.
+    from pyuvdata import UVData
+
     print("pyuvdata:")
     print("======================================")
     UV = UVData()
@@ -131,20 +134,27 @@ def dump_pyuvdata(ant1, ant2, timestep_index, fine_chan_index, fine_chan_count,
                   f"YX: {data[timestep_index, chan, 2].real:.2f} {data[timestep_index, chan, 2].imag:.2f},\t"
                   f"YY: {data[timestep_index, chan, 3].real:.2f} {data[timestep_index, chan, 3].imag:.2f}")
     else:
-        with open(out_filename, "w") as out_file:
-            for a1 in range(0, 128):
-                for a2 in range(a1, 128):
-                    data = UV.get_data(a1, a2)
+        # Build the blt row for each triangular (a1, a2) pair once, then
+        # gather the whole timestep from data_array in one fancy-indexed
+        # slice instead of 8256 UV.get_data calls, each of which copies
+        # its baseline out.
+        blt_index = np.array([UV.antpair2ind(a1, a2)[timestep_index]
+                              for a1 in range(0, 128)
+                              for a2 in range(a1, 128)])
+
+        slab = UV.data_array[blt_index, 0, fine_chan_index:fine_chan_index + fine_chan_count, :]
 
-                    for chan in range(fine_chan_index, fine_chan_index + fine_chan_count):
-                        out_file.write(f"{data[timestep_index, chan, 0].real},{data[timestep_index, chan, 0].imag},"
-                                       f"{data[timestep_index, chan, 1].real},{data[timestep_index, chan, 1].imag},"
-                                       f"{data[timestep_index, chan, 2].real},{data[timestep_index, chan, 2].imag},"
-                                       f"{data[timestep_index, chan, 3].real},{data[timestep_index, chan, 3].imag}\n")
+        # Viewing complex128 as float64 interleaves real/imag per pol,
+        # matching the xx_r,xx_i,...,yy_i column order.
+        rows = np.ascontiguousarray(slab, dtype=np.complex128).view(np.float64).reshape(-1, 8)
+        np.savetxt(out_filename, rows, fmt="%g", delimiter=",")
 
         print(f"Wrote {out_filename}")
 
 def dump_casa(ant1, ant2, timestep_index, fine_chan_index, fine_chan_count, ms_filename, out_filename):
+    # casacore is only needed when a measurement set was supplied.
+    import casacore.tables
+
     print("casa:")
     print("======================================")
 
@@ -168,52 +178,34 @@ def dump_casa(ant1, ant2, timestep_index, fine_chan_index, fine_chan_count, ms_f
                   f"YX: {data[chan, 2].real:.2f} {data[chan, 2].imag:.2f},\t"
                   f"YY: {data[chan, 3].real:.2f} {data[chan, 3].imag:.2f}")
     else:
-        with open(out_filename, "w") as out_file:
-            # Rows in the ms include baseline AND time. So we need to move down the table by n_bls x timestep
-            n_bls = int((128 * 129) / 2)
+        # Rows in the ms include baseline AND time, so one timestep's
+        # baselines are a contiguous block; fetch the whole
+        # (n_bls, n_chan, 4) slab with a single bulk getcol rather than
+        # one C++ round trip per row.
+        n_bls = int((128 * 129) / 2)
 
-            for baseline_index in range(0, n_bls):
-                row_index = int(n_bls * timestep_index) + baseline_index
+        data_cube = t.getcol('DATA', startrow=int(n_bls * timestep_index), nrow=n_bls)
+        data_cube = data_cube[:, fine_chan_index:fine_chan_index + fine_chan_count, :]
 
-                data = tr[row_index]['DATA']
-                for chan in range(fine_chan_index, fine_chan_index + fine_chan_count):
-                    out_file.write(f"{data[chan, 0].real},{data[chan, 0].imag},"
-                                   f"{data[chan, 1].real},{data[chan, 1].imag},"
-                                   f"{data[chan, 2].real},{data[chan, 2].imag},"
-                                   f"{data[chan, 3].real},{data[chan, 3].imag}\n")
+        # Viewing complex128 as float64 interleaves real/imag per pol,
+        # matching the xx_r,xx_i,...,yy_i column order.
+        rows = np.ascontiguousarray(data_cube, dtype=np.complex128).view(np.float64).reshape(-1, 8)
+        np.savetxt(out_filename, rows, fmt="%g", delimiter=",")
 
         print(f"Wrote {out_filename}")
 
 
-def compare_lines(line1, line2):
-    # Each line is a set of floats, comma separated
-    # xx_r,xx_i,xy_r,xy_i,yx_r,yx_i,yy_r,yy_i
-    floats1 = line1.split(",")
-    floats2 = line2.split(",")
-
-    mismatch = False
-
-    for i, f in enumerate(floats1):
-        if abs(float(f) - float(floats2[i])) > 0.01:
-            mismatch = True
-
-    return mismatch
-
 def compare_csv(filename1, filename2):
     print(f"Comparing {filename1} with {filename2}")
-    with open(filename1, "r") as file1:
-        with open(filename2, "r") as file2:
-            line_no = 1
-            num_bl = int(128*129/2)
-            num_fine_chans = 32
 
-            while line_no < num_bl * num_fine_chans:
-                line1 = file1.readline()
-                line2 = file2.readline()
+    # Each row is xx_r,xx_i,xy_r,xy_i,yx_r,yx_i,yy_r,yy_i. Load both
+    # files once and compare every value in one vectorized pass; a row
+    # mismatches if any column differs by more than 0.01.
+    csv1 = np.loadtxt(filename1, delimiter=",")
+    csv2 = np.loadtxt(filename2, delimiter=",")
 
-                if compare_lines(line1, line2):
-                    print(f"Line: {line_no} mismatch:\n>>{line1}<<{line2}")
-                line_no += 1
+    for line_index in np.flatnonzero(np.abs(csv1 - csv2).max(axis=1) > 0.01):
+        print(f"Line: {line_index + 1} mismatch:\n>>{csv1[line_index]}\n<<{csv2[line_index]}")
 
     print(f"Finished comparing {filename1} with {filename2}")
 
@@ -238,10 +230,22 @@ if __name__ == "__main__":
     fine_chan_index = 0
     fine_chan_count = 128  # 10kHz obs=128, 20kHz=64, 40kHz=32
 
-    dump_mwalib(ant1, ant2, timestep_index, fine_chan_index, fine_chan_count, args.gpuboxes, args.metafits, None if args.console_output else "mwalib.csv")
-    dump_pyuvdata(ant1, ant2, timestep_index, fine_chan_index, fine_chan_count, args.gpuboxes, args.metafits, None if args.console_output else "pyuvdata.csv")
+    # The dumps read disjoint inputs and write disjoint CSVs, so run
+    # them in worker processes (pyuvdata holds the GIL through heavy
+    # Python code, so threads would not overlap) and wait on all of
+    # them; wall time is the slowest dump rather than the sum.
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(dump_mwalib, ant1, ant2, timestep_index, coarse_chan_index, fine_chan_index,
+                                   fine_chan_count, args.gpuboxes, args.metafits,
+                                   None if args.console_output else "mwalib.csv"),
+                   executor.submit(dump_pyuvdata, ant1, ant2, timestep_index, fine_chan_index, fine_chan_count,
+                                   args.gpuboxes, args.metafits, None if args.console_output else "pyuvdata.csv")]
+
+        if args.casa_ms:
+            futures.append(executor.submit(dump_casa, ant1, ant2, timestep_index, fine_chan_index, fine_chan_count,
+                                           args.casa_ms, None if args.console_output else "cotter.csv"))
+        else:
+            print("No cotter input file provided, so no cotter comparison will be produced.")
 
-    if args.casa_ms:
-        dump_casa(ant1, ant2, timestep_index, fine_chan_index, fine_chan_count, args.casa_ms, None if args.console_output else "cotter.csv")
-    else:
-        print("No cotter input file provided, so no cotter comparison will be produced.")
+        for future in futures:
+            future.result()